@@ -11,10 +11,11 @@ This module provides effort estimation and progress tracking for autonomous deve
 
 import json
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 
 class EffortUnit(Enum):
@@ -37,6 +38,14 @@ class ProgressPhase(Enum):
     COMPLETE = "complete"
 
 
+# Hours per unit for units with a fixed conversion rate; story points and
+# days depend on caller-supplied rates in EffortEstimate.to_hours
+_FIXED_HOURS_PER_UNIT: dict[EffortUnit, float] = {
+    EffortUnit.HOURS: 1.0,
+    EffortUnit.TOKENS: 1 / 10000,  # Rough estimate (10k tokens ~ 1 hour)
+}
+
+
 @dataclass
 class EffortEstimate:
     """An effort estimate for a task."""
@@ -56,20 +65,20 @@ class EffortEstimate:
         Returns:
             Estimated hours
         """
-        if self.unit == EffortUnit.HOURS:
-            return self.value
-        elif self.unit == EffortUnit.DAYS:
-            return self.value * hours_per_day
-        elif self.unit == EffortUnit.STORY_POINTS:
-            return self.value * hours_per_point
-        else:
-            # Tokens - rough estimate (10k tokens ~ 1 hour)
-            return self.value / 10000
+        factor = _FIXED_HOURS_PER_UNIT.get(self.unit)
+        if factor is None:
+            factor = hours_per_point if self.unit is EffortUnit.STORY_POINTS else hours_per_day
+        return self.value * factor
 
 
 @dataclass
 class TaskProgress:
-    """Progress tracking for a single task."""
+    """Progress tracking for a single task.
+
+    Only the most recent NOTES_MAX notes are kept; older ones are dropped.
+    """
+
+    NOTES_MAX: ClassVar[int] = 256
 
     task_id: str
     name: str
@@ -78,12 +87,16 @@ class TaskProgress:
     estimate: EffortEstimate | None = None
     actual_effort: float = 0
     effort_unit: EffortUnit = EffortUnit.HOURS
-    notes: list[str] = field(default_factory=list)
+    notes: deque[str] = field(default_factory=deque)
     created_at: float = field(default_factory=time.time)
     started_at: float | None = None
     completed_at: float | None = None
     _timer_start: float | None = field(default=None, repr=False)
 
+    def __post_init__(self) -> None:
+        """Bound the notes buffer to NOTES_MAX entries."""
+        self.notes = deque(self.notes, maxlen=self.NOTES_MAX)
+
     def set_phase(self, phase: ProgressPhase) -> None:
         """Set the current phase.
 
@@ -493,7 +506,7 @@ class ProgressTracker:
                     "phase": p.phase.value,
                     "completion_percentage": p.completion_percentage,
                     "actual_effort": p.actual_effort,
-                    "notes": p.notes,
+                    "notes": list(p.notes),
                     "estimate": {
                         "value": p.estimate.value,
                         "unit": p.estimate.unit.value,
@@ -545,7 +558,7 @@ class ProgressTracker:
             progress.phase = ProgressPhase(task_data["phase"])
             progress.completion_percentage = task_data["completion_percentage"]
             progress.actual_effort = task_data.get("actual_effort", 0)
-            progress.notes = task_data.get("notes", [])
+            progress.notes.extend(task_data.get("notes", []))
 
             if task_data.get("estimate"):
                 estimate = EffortEstimate(
@@ -11,17 +11,24 @@ sessions. It includes:
 - Structured requirements output
 """
 
+import heapq
 import re
+import string
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
+from itertools import chain
+from operator import attrgetter
 from typing import Any
 
 
-class RequirementCategory(Enum):
+class RequirementCategory(IntEnum):
     """Categories of requirements information.
 
     Values represent priority (lower = higher priority).
     Order: Problem > Success Criteria > Stakeholders > Context > Constraints
+
+    Members are ints, so comparisons, hashing and priority ordering use plain
+    integer operations.
     """
 
     PROBLEM = 1
@@ -31,7 +38,7 @@ class RequirementCategory(Enum):
     CONSTRAINTS = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class InformationGap:
     """Represents a gap in requirements information.
 
@@ -80,10 +87,13 @@ class CompletenessScore:
         return self.total >= threshold
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuestionOption:
     """A predefined option for answering a question.
 
+    Options are immutable so the shared QUESTION_TEMPLATES instances can be
+    reused by every generated question.
+
     Attributes:
         id: Unique identifier for the option (1-based)
         label: Short label for the option
@@ -97,7 +107,7 @@ class QuestionOption:
     is_custom: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetedQuestion:
     """A question designed to fill an information gap.
 
@@ -135,7 +145,34 @@ class TargetedQuestion:
         return self.options + [other_option]
 
 
-@dataclass
+_NOT_SPECIFIED = "*Not specified*"
+
+# Markdown layout for StructuredRequirements.to_markdown, rendered in one pass
+_MD_TEMPLATE = string.Template(
+    "# Requirements\n\n"
+    "## Problem Statement\n$problem\n\n"
+    "## Success Criteria\n$criteria\n\n"
+    "## Stakeholders\n$stakeholders\n\n"
+    "## Context\n$context\n\n"
+    "## Constraints\n$constraints\n"
+)
+
+
+def _bullet_list(items: list[str]) -> str:
+    """Render items as a markdown bullet list.
+
+    Args:
+        items: Items to render
+
+    Returns:
+        One "- item" line per item, or the not-specified marker if empty
+    """
+    if not items:
+        return _NOT_SPECIFIED
+    return "\n".join(f"- {item}" for item in items)
+
+
+@dataclass(slots=True)
 class StructuredRequirements:
     """Structured output of requirements analysis.
 
@@ -159,41 +196,13 @@ class StructuredRequirements:
         Returns:
             Markdown-formatted requirements document
         """
-        lines = ["# Requirements", ""]
-
-        lines.append("## Problem Statement")
-        lines.append(self.problem_statement or "*Not specified*")
-        lines.append("")
-
-        lines.append("## Success Criteria")
-        if self.success_criteria:
-            for criterion in self.success_criteria:
-                lines.append(f"- {criterion}")
-        else:
-            lines.append("*Not specified*")
-        lines.append("")
-
-        lines.append("## Stakeholders")
-        if self.stakeholders:
-            for stakeholder in self.stakeholders:
-                lines.append(f"- {stakeholder}")
-        else:
-            lines.append("*Not specified*")
-        lines.append("")
-
-        lines.append("## Context")
-        lines.append(self.context or "*Not specified*")
-        lines.append("")
-
-        lines.append("## Constraints")
-        if self.constraints:
-            for constraint in self.constraints:
-                lines.append(f"- {constraint}")
-        else:
-            lines.append("*Not specified*")
-        lines.append("")
-
-        return "\n".join(lines)
+        return _MD_TEMPLATE.substitute(
+            problem=self.problem_statement or _NOT_SPECIFIED,
+            criteria=_bullet_list(self.success_criteria),
+            stakeholders=_bullet_list(self.stakeholders),
+            context=self.context or _NOT_SPECIFIED,
+            constraints=_bullet_list(self.constraints),
+        )
 
 
 @dataclass
@@ -231,8 +240,8 @@ class RequirementsAnalysis:
         Returns:
             List of questions sorted by priority
         """
-        sorted_questions = sorted(self.questions, key=lambda q: q.priority)
-        return sorted_questions[:n]
+        # Partial selection: O(Q log n) instead of sorting every question
+        return heapq.nsmallest(n, self.questions, key=attrgetter("priority"))
 
     def build_structured_requirements(self) -> StructuredRequirements:
         """Build structured requirements from extracted data.
@@ -323,6 +332,124 @@ CONSTRAINT_PATTERNS = [
     re.compile(r"(backward\s+)?compat", re.IGNORECASE),
 ]
 
+# Pattern definitions for extracting requirement text. Section patterns
+# (single statement) span lines; list-item patterns collect every match.
+# Unbounded runs such as [a-z]+ and \d+ are anchored with a lookbehind so
+# the engine starts them only at the beginning of a run. The leftmost match
+# is unchanged, but retries from every character inside a word or number
+# are skipped.
+PROBLEM_EXTRACTION_PATTERNS = [
+    re.compile(r"problem[:\s]+(.+?)(?=success|stakeholder|context|constraint|$)", re.IGNORECASE | re.DOTALL),
+    re.compile(r"the\s+(main|core|primary)\s+(problem|issue)\s+is\s+(.+?)(?=\.|success|$)", re.IGNORECASE | re.DOTALL),
+    re.compile(r"users?\s+(cannot|can't|struggle|are unable)\s+(.+?)(?=\.|this|$)", re.IGNORECASE | re.DOTALL),
+]
+
+SUCCESS_EXTRACTION_PATTERNS = [
+    re.compile(r"success[:\s]+(.+?)(?=stakeholder|context|constraint|$)", re.IGNORECASE),
+    re.compile(r"success\s+means?[:\s]+(.+?)(?=stakeholder|context|constraint|$)", re.IGNORECASE),
+    re.compile(r"((?<!\d)\d+%\s+[^.]+)", re.IGNORECASE),
+    re.compile(r"(>|<|>=|<=)\s*\d+[^.]*", re.IGNORECASE),
+]
+
+STAKEHOLDER_EXTRACTION_PATTERNS = [
+    re.compile(r"stakeholder[s]?[:\s]+(.+?)(?=context|constraint|$)", re.IGNORECASE),
+    re.compile(r"(end\s+users?|customers?|(?<![a-z])[a-z]+\s+team)[^.]*", re.IGNORECASE),
+]
+
+CONTEXT_EXTRACTION_PATTERNS = [
+    re.compile(r"context[:\s]+(.+?)(?=constraint|$)", re.IGNORECASE | re.DOTALL),
+    re.compile(r"background[:\s]+(.+?)(?=constraint|$)", re.IGNORECASE | re.DOTALL),
+    re.compile(r"(currently|existing)[:\s]+(.+?)(?=\.|constraint|$)", re.IGNORECASE | re.DOTALL),
+]
+
+CONSTRAINT_EXTRACTION_PATTERNS = [
+    re.compile(r"constraint[s]?[:\s]+(.+?)(?=$)", re.IGNORECASE),
+    re.compile(r"(must|cannot|can't)\s+[^.]+", re.IGNORECASE),
+    re.compile(r"((?<!\d)\d+\s*(week|day|month)[s]?\s*(timeline|deadline)?)", re.IGNORECASE),
+]
+
+# Lowercase literals that every match of a pattern must contain, aligned
+# index-for-index with the *_PATTERNS lists above. A pattern whose keywords
+# are all absent from the description cannot match, so its regex is skipped.
+PATTERN_KEYWORDS: dict[RequirementCategory, list[tuple[str, ...]]] = {
+    RequirementCategory.PROBLEM: [
+        ("problem",),
+        ("problem",),
+        ("issue",),
+        ("challenge",),
+        ("user",),
+        ("frustration", "problem", "issue"),
+        ("pain",),
+        ("problem", "issue"),
+        ("bug", "issue", "problem"),
+        ("conflict", "lost", "productivity"),
+        ("affect",),
+    ],
+    RequirementCategory.SUCCESS_CRITERIA: [
+        ("success",),
+        ("success",),
+        ("success",),
+        ("goal", "objective"),
+        ("measure", "metric", "kpi"),
+        ("%",),
+        (">", "<"),
+        ("rating", "score"),
+        ("achieve", "reach", "hit"),
+        ("%",),
+        ("zero",),
+        ("latency",),
+        ("satisfaction",),
+    ],
+    RequirementCategory.STAKEHOLDERS: [
+        ("stakeholder",),
+        ("stakeholder",),
+        ("user",),
+        ("customer", "client"),
+        ("team",),
+        ("developer", "engineer", "designer", "product", "qa", "support"),
+        ("primary", "secondary"),
+        ("team",),
+        ("affect", "impact"),
+        ("writer", "editor", "reviewer"),
+        ("engineering", "support"),
+        ("roadmap",),
+    ],
+    RequirementCategory.CONTEXT: [
+        ("context",),
+        ("context",),
+        ("background",),
+        ("current", "existing"),
+        ("react", "vue", "angular", "python", "node", "django", "mongodb"),
+        ("migrat",),
+        ("monolith", "microservice", "api", "database"),
+        ("last", "recent", "previous"),
+        ("part", "integrate"),
+        ("daily",),
+        ("mobile",),
+        ("backend",),
+    ],
+    RequirementCategory.CONSTRAINTS: [
+        ("constraint",),
+        ("constraint",),
+        ("limitation",),
+        ("must", "can't", "not", "won't"),
+        ("timeline", "deadline", "due"),
+        ("week", "day", "hour", "month"),
+        ("budget",),
+        ("limited", "restrict", "within"),
+        ("compliance", "gdpr", "hipaa", "security"),
+        ("compat",),
+    ],
+}
+
+# Every detection keyword; text containing none of them matches no pattern
+ALL_PATTERN_KEYWORDS: frozenset[str] = frozenset(
+    keyword
+    for category_keywords in PATTERN_KEYWORDS.values()
+    for keywords in category_keywords
+    for keyword in keywords
+)
+
 # Question templates for each category
 QUESTION_TEMPLATES: dict[RequirementCategory, dict[str, Any]] = {
     RequirementCategory.PROBLEM: {
@@ -372,6 +499,15 @@ QUESTION_TEMPLATES: dict[RequirementCategory, dict[str, Any]] = {
     },
 }
 
+# Gap descriptions used when a category is missing or weak
+GAP_DESCRIPTIONS: dict[RequirementCategory, str] = {
+    RequirementCategory.PROBLEM: "No clear problem statement found",
+    RequirementCategory.SUCCESS_CRITERIA: "No success criteria or metrics defined",
+    RequirementCategory.STAKEHOLDERS: "No stakeholders or affected parties identified",
+    RequirementCategory.CONTEXT: "Missing background or contextual information",
+    RequirementCategory.CONSTRAINTS: "No constraints or limitations specified",
+}
+
 # Category weights for scoring (must sum to 100)
 CATEGORY_WEIGHTS: dict[RequirementCategory, int] = {
     RequirementCategory.PROBLEM: 30,
@@ -381,6 +517,12 @@ CATEGORY_WEIGHTS: dict[RequirementCategory, int] = {
     RequirementCategory.CONSTRAINTS: 15,
 }
 
+# Presence score for a category matched by 0, 1 or 2 patterns
+PRESENCE_BY_MATCH_COUNT: tuple[float, ...] = (0.0, 0.33, 0.66)
+
+# Match count at which presence reaches 1.0; further matches cannot raise it
+FULL_PRESENCE_MATCH_COUNT = 6
+
 
 class RequirementsAnalyzer:
     """Analyzes task descriptions for requirements completeness.
@@ -401,17 +543,25 @@ class RequirementsAnalyzer:
 
         structured = result.build_structured_requirements()
         print(structured.to_markdown())
+
+    The analyzer only reads its pattern tables after construction and keeps
+    no per-call state, so one instance can be shared across threads, tests
+    and worker processes.
     """
 
     def __init__(self) -> None:
         """Initialize the requirements analyzer."""
-        self._patterns: dict[RequirementCategory, list[re.Pattern]] = {
+        patterns: dict[RequirementCategory, list[re.Pattern]] = {
             RequirementCategory.PROBLEM: PROBLEM_PATTERNS,
             RequirementCategory.SUCCESS_CRITERIA: SUCCESS_PATTERNS,
             RequirementCategory.STAKEHOLDERS: STAKEHOLDER_PATTERNS,
             RequirementCategory.CONTEXT: CONTEXT_PATTERNS,
             RequirementCategory.CONSTRAINTS: CONSTRAINT_PATTERNS,
         }
+        self._patterns: dict[RequirementCategory, list[tuple[re.Pattern, tuple[str, ...]]]] = {
+            category: list(zip(category_patterns, PATTERN_KEYWORDS[category], strict=True))
+            for category, category_patterns in patterns.items()
+        }
 
     def analyze(self, description: str) -> RequirementsAnalysis:
         """Analyze a task description for requirements completeness.
@@ -425,8 +575,16 @@ class RequirementsAnalyzer:
         if not description or not description.strip():
             return self._empty_analysis(description)
 
+        # Scan for catalog keywords once and share the hits with every
+        # detector. Only ASCII text is scanned, because there lower() agrees
+        # with the regexes' IGNORECASE matching
+        keywords_found: frozenset[str] | None = None
+        if description.isascii():
+            lowered = description.lower()
+            keywords_found = frozenset(kw for kw in ALL_PATTERN_KEYWORDS if kw in lowered)
+
         # Detect presence of each category
-        category_presence = self._detect_category_presence(description)
+        category_presence = self._detect_category_presence(description, keywords_found)
 
         # Calculate scores
         score = self._calculate_score(category_presence)
@@ -477,34 +635,46 @@ class RequirementsAnalyzer:
             extracted_requirements={}
         )
 
-    def _detect_category_presence(self, description: str) -> dict[RequirementCategory, float]:
+    def _detect_category_presence(
+        self,
+        description: str,
+        keywords_found: frozenset[str] | None
+    ) -> dict[RequirementCategory, float]:
         """Detect how well each category is represented in the description.
 
         Args:
             description: The task description
+            keywords_found: Catalog keywords present in the lowercased
+                description, or None to run every pattern (non-ASCII input)
 
         Returns:
             Dict mapping each category to a presence score (0.0-1.0)
         """
+        # Fast path for trivial input ("x", "Build a thing"): with no keyword
+        # present, no pattern can match and every category scores zero
+        if keywords_found is not None and not keywords_found:
+            return dict.fromkeys(self._patterns, 0.0)
+
         presence: dict[RequirementCategory, float] = {}
 
         for category, patterns in self._patterns.items():
             matches = 0
-            for pattern in patterns:
+            for pattern, keywords in patterns:
+                if keywords_found is not None and keywords_found.isdisjoint(keywords):
+                    continue
                 if pattern.search(description):
                     matches += 1
+                    if matches == FULL_PRESENCE_MATCH_COUNT:
+                        # Saturated: skip the remaining full-text scans
+                        break
 
             # Calculate presence score based on pattern matches
-            # 2 matches = 50%, 3+ matches = 75-100%
-            # This scales better with varying pattern counts
-            if matches == 0:
-                presence[category] = 0.0
-            elif matches == 1:
-                presence[category] = 0.33
-            elif matches == 2:
-                presence[category] = 0.66
+            # 0-2 matches come from a lookup table; 3+ matches = 85% or
+            # higher, capped at 100%. This scales better with varying
+            # pattern counts
+            if matches < len(PRESENCE_BY_MATCH_COUNT):
+                presence[category] = PRESENCE_BY_MATCH_COUNT[matches]
             else:
-                # 3+ matches = 85% or higher, capped at 100%
                 presence[category] = min(1.0, 0.85 + (matches - 3) * 0.05)
 
         return presence
@@ -548,21 +718,13 @@ class RequirementsAnalyzer:
         """
         gaps: list[InformationGap] = []
 
-        gap_descriptions: dict[RequirementCategory, str] = {
-            RequirementCategory.PROBLEM: "No clear problem statement found",
-            RequirementCategory.SUCCESS_CRITERIA: "No success criteria or metrics defined",
-            RequirementCategory.STAKEHOLDERS: "No stakeholders or affected parties identified",
-            RequirementCategory.CONTEXT: "Missing background or contextual information",
-            RequirementCategory.CONSTRAINTS: "No constraints or limitations specified",
-        }
-
         for category, presence in category_presence.items():
             # Create gap if presence is below threshold
             if presence < 0.5:
                 severity = 1.0 - presence  # Lower presence = higher severity
                 gaps.append(InformationGap(
                     category=category,
-                    description=gap_descriptions.get(
+                    description=GAP_DESCRIPTIONS.get(
                         category,
                         f"Missing {category.name.lower()} information"
                     ),
@@ -581,7 +743,11 @@ class RequirementsAnalyzer:
         Returns:
             List of TargetedQuestion objects
         """
-        questions: list[TargetedQuestion] = []
+        # Priority is the category value (1-5), so bucket by category instead
+        # of running a comparison sort; buckets keep gap order within a category
+        buckets: dict[RequirementCategory, list[TargetedQuestion]] = {
+            category: [] for category in RequirementCategory
+        }
 
         for gap in gaps:
             template = QUESTION_TEMPLATES.get(gap.category)
@@ -595,12 +761,9 @@ class RequirementsAnalyzer:
                 priority=gap.category.value,  # Priority matches category order
                 gap=gap
             )
-            questions.append(question)
-
-        # Sort by priority (category value)
-        questions.sort(key=lambda q: q.priority)
+            buckets[gap.category].append(question)
 
-        return questions
+        return list(chain.from_iterable(buckets.values()))
 
     def _extract_requirements(
         self,
@@ -619,64 +782,44 @@ class RequirementsAnalyzer:
         extracted: dict[str, Any] = {}
 
         # Extract problem statement
-        problem_match = self._extract_section(description, [
-            r"problem[:\s]+(.+?)(?=success|stakeholder|context|constraint|$)",
-            r"the\s+(main|core|primary)\s+(problem|issue)\s+is\s+(.+?)(?=\.|success|$)",
-            r"users?\s+(cannot|can't|struggle|are unable)\s+(.+?)(?=\.|this|$)",
-        ])
+        problem_match = self._extract_section(description, PROBLEM_EXTRACTION_PATTERNS)
         if problem_match:
             extracted["problem_statement"] = problem_match.strip()
 
         # Extract success criteria
-        success_matches = self._extract_list_items(description, [
-            r"success[:\s]+(.+?)(?=stakeholder|context|constraint|$)",
-            r"success\s+means?[:\s]+(.+?)(?=stakeholder|context|constraint|$)",
-            r"(\d+%\s+[^.]+)",
-            r"(>|<|>=|<=)\s*\d+[^.]*",
-        ])
+        success_matches = self._extract_list_items(description, SUCCESS_EXTRACTION_PATTERNS)
         if success_matches:
             extracted["success_criteria"] = success_matches
 
         # Extract stakeholders
-        stakeholder_matches = self._extract_list_items(description, [
-            r"stakeholder[s]?[:\s]+(.+?)(?=context|constraint|$)",
-            r"(end\s+users?|customers?|[a-z]+\s+team)[^.]*",
-        ])
+        stakeholder_matches = self._extract_list_items(description, STAKEHOLDER_EXTRACTION_PATTERNS)
         if stakeholder_matches:
             extracted["stakeholders"] = stakeholder_matches
 
         # Extract context
-        context_match = self._extract_section(description, [
-            r"context[:\s]+(.+?)(?=constraint|$)",
-            r"background[:\s]+(.+?)(?=constraint|$)",
-            r"(currently|existing)[:\s]+(.+?)(?=\.|constraint|$)",
-        ])
+        context_match = self._extract_section(description, CONTEXT_EXTRACTION_PATTERNS)
         if context_match:
             extracted["context"] = context_match.strip()
 
         # Extract constraints
-        constraint_matches = self._extract_list_items(description, [
-            r"constraint[s]?[:\s]+(.+?)(?=$)",
-            r"(must|cannot|can't)\s+[^.]+",
-            r"(\d+\s*(week|day|month)[s]?\s*(timeline|deadline)?)",
-        ])
+        constraint_matches = self._extract_list_items(description, CONSTRAINT_EXTRACTION_PATTERNS)
         if constraint_matches:
             extracted["constraints"] = constraint_matches
 
         return extracted
 
-    def _extract_section(self, text: str, patterns: list[str]) -> str | None:
+    def _extract_section(self, text: str, patterns: list[re.Pattern]) -> str | None:
         """Extract a section of text matching any pattern.
 
         Args:
             text: Text to search
-            patterns: List of regex patterns to try
+            patterns: Compiled regex patterns to try in order
 
         Returns:
             First matching group or None
         """
         for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+            match = pattern.search(text)
             if match:
                 # Return the last group (most specific)
                 groups = match.groups()
@@ -685,12 +828,12 @@ class RequirementsAnalyzer:
 
         return None
 
-    def _extract_list_items(self, text: str, patterns: list[str]) -> list[str]:
+    def _extract_list_items(self, text: str, patterns: list[re.Pattern]) -> list[str]:
         """Extract list items matching patterns.
 
         Args:
             text: Text to search
-            patterns: List of regex patterns to try
+            patterns: Compiled regex patterns to try
 
         Returns:
             List of unique matched items
@@ -698,7 +841,7 @@ class RequirementsAnalyzer:
         items: set[str] = set()
 
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern.findall(text)
             for match in matches:
                 # Use ternary to extract item from tuple or string match
                 item = (match[-1] if match[-1] else match[0]) if isinstance(match, tuple) else match
@@ -9,14 +9,25 @@ This module provides root cause analysis for autonomous development:
 - Integration with error classifier
 """
 
+import heapq
 import json
+import os
 import re
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
+# Patterns for parsing errors and tracebacks
+ERROR_TYPE_PATTERN = re.compile(r"(\w+Error|\w+Exception):")
+LEADING_ERROR_TYPE_PATTERN = re.compile(r"^(\w+Error|\w+Exception)", re.MULTILINE)
+# Pseudo-files such as <stdin> or <string> are rejected by the lookahead
+TRACEBACK_FILE_PATTERN = re.compile(r'File ["\'](?!<)([^"\']+)["\']')
+
 
 class EvidenceType(Enum):
     """Types of evidence for root cause analysis."""
@@ -30,7 +41,7 @@ class EvidenceType(Enum):
     SYSTEM_STATE = "system_state"
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     """A piece of evidence for root cause analysis."""
 
@@ -42,7 +53,7 @@ class Evidence:
     timestamp: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class Hypothesis:
     """A hypothesis about the root cause."""
 
@@ -69,7 +80,7 @@ class Hypothesis:
         self.rejection_reason = reason
 
 
-@dataclass
+@dataclass(slots=True)
 class CausalChain:
     """A chain of events leading to an error."""
 
@@ -108,7 +119,7 @@ class CausalChain:
         return len(self.steps)
 
 
-@dataclass
+@dataclass(slots=True)
 class RootCause:
     """The determined root cause of an error."""
 
@@ -121,7 +132,7 @@ class RootCause:
     related_errors: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Investigation:
     """An investigation into an error."""
 
@@ -171,10 +182,8 @@ class Investigation:
         Returns:
             List of hypotheses
         """
-        sorted_hypotheses = sorted(
-            self.hypotheses, key=lambda h: h.confidence, reverse=True
-        )
-        return sorted_hypotheses[:limit]
+        # Partial selection: O(N log limit) instead of sorting every hypothesis
+        return heapq.nlargest(limit, self.hypotheses, key=attrgetter("confidence"))
 
     def get_affected_files(self) -> list[str]:
         """Get list of affected files.
@@ -284,6 +293,24 @@ class RootCauseAnalyzer:
         ],
     }
 
+    # Error categories by error type
+    ERROR_CATEGORIES = {
+        "SyntaxError": "syntax",
+        "IndentationError": "syntax",
+        "ImportError": "import",
+        "ModuleNotFoundError": "import",
+        "TypeError": "type",
+        "ValueError": "validation",
+        "KeyError": "data",
+        "IndexError": "data",
+        "AttributeError": "attribute",
+        "NameError": "reference",
+        "RuntimeError": "runtime",
+        "OSError": "system",
+        "IOError": "io",
+        "FileNotFoundError": "io",
+    }
+
     def __init__(self) -> None:
         """Initialize root cause analyzer."""
         self._investigations: list[Investigation] = []
@@ -299,6 +326,51 @@ class RootCauseAnalyzer:
             error: Error message or traceback
             classification: Optional error classification from F009
 
+        Returns:
+            Investigation object
+        """
+        investigation = self._build_investigation(error)
+
+        # Store investigation
+        self._investigations.append(investigation)
+
+        return investigation
+
+    def analyze_batch(
+        self,
+        errors: list[str],
+        max_workers: int | None = None,
+    ) -> list[Investigation]:
+        """Analyze independent errors in parallel worker processes.
+
+        Investigations are returned and stored in the same order as errors.
+        Batches of one error, max_workers=1 and subclasses are analyzed
+        in-process with analyze(), since workers run a plain RootCauseAnalyzer.
+
+        Args:
+            errors: Error messages or tracebacks
+            max_workers: Worker process count (defaults to the CPU count)
+
+        Returns:
+            List of Investigation objects
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(errors))
+        if workers <= 1 or type(self) is not RootCauseAnalyzer:
+            return [self.analyze(error) for error in errors]
+
+        chunksize = max(1, len(errors) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            investigations = list(executor.map(_analyze_error, errors, chunksize=chunksize))
+
+        self._investigations.extend(investigations)
+        return investigations
+
+    def _build_investigation(self, error: str) -> Investigation:
+        """Build an investigation for an error without storing it.
+
+        Args:
+            error: Error message or traceback
+
         Returns:
             Investigation object
         """
@@ -321,9 +393,6 @@ class RootCauseAnalyzer:
         # Generate hypotheses
         self._generate_hypotheses(investigation)
 
-        # Store investigation
-        self._investigations.append(investigation)
-
         return investigation
 
     def _extract_error_type(self, error: str) -> str:
@@ -336,12 +405,12 @@ class RootCauseAnalyzer:
             Error type name
         """
         # Match patterns like "TypeError:", "KeyError:", etc.
-        match = re.search(r"(\w+Error|\w+Exception):", error)
+        match = ERROR_TYPE_PATTERN.search(error)
         if match:
             return match.group(1)
 
         # Check for error type at start of line
-        match = re.search(r"^(\w+Error|\w+Exception)", error, re.MULTILINE)
+        match = LEADING_ERROR_TYPE_PATTERN.search(error)
         if match:
             return match.group(1)
 
@@ -384,14 +453,9 @@ class RootCauseAnalyzer:
         Returns:
             List of file paths
         """
-        files = []
-        # Match File "path", line N patterns
-        for match in re.finditer(r'File ["\']([^"\']+)["\']', error):
-            filepath = match.group(1)
-            if not filepath.startswith("<"):  # Ignore <stdin>, etc.
-                files.append(filepath)
-
-        return files
+        # Match File "path", line N patterns in a single pass. Paths are interned
+        # because retained investigations repeat the same few files many times.
+        return list(map(sys.intern, TRACEBACK_FILE_PATTERN.findall(error)))
 
     def _generate_hypotheses(self, investigation: Investigation) -> None:
         """Generate hypotheses based on evidence.
@@ -402,16 +466,14 @@ class RootCauseAnalyzer:
         error_type = investigation.error_type
         error_message = investigation.error_message
 
-        # Get patterns for this error type
-        base_type = error_type.replace("Error", "").replace("Exception", "")
-
-        # Check for NoneType specific patterns
+        # Check for NoneType specific patterns, then the exact type, then its base name
         if "NoneType" in error_message:
-            patterns = self.ERROR_PATTERNS.get("NoneType", [])
+            patterns = self.ERROR_PATTERNS.get("NoneType", ())
         else:
-            patterns = self.ERROR_PATTERNS.get(error_type, [])
+            patterns = self.ERROR_PATTERNS.get(error_type, ())
             if not patterns:
-                patterns = self.ERROR_PATTERNS.get(base_type, [])
+                base_type = error_type.replace("Error", "").replace("Exception", "")
+                patterns = self.ERROR_PATTERNS.get(base_type, ())
 
         for description, confidence in patterns:
             investigation.add_hypothesis(
@@ -439,20 +501,14 @@ class RootCauseAnalyzer:
         Returns:
             CausalChain object
         """
-        chain = CausalChain()
-
-        # Extract file/line info from traceback
-        files = investigation.get_affected_files()
-
-        # Build chain from traceback (root to immediate)
-        for file_path in files:
-            chain.add_step(f"Execution in {file_path}")
+        # Build chain from traceback (root to immediate) in one pass
+        steps = [f"Execution in {file_path}" for file_path in investigation.get_affected_files()]
 
         # Add the error itself as final step
         if investigation.error_type:
-            chain.add_step(f"{investigation.error_type} raised")
+            steps.append(f"{investigation.error_type} raised")
 
-        return chain
+        return CausalChain(steps=steps)
 
     def determine_root_cause(self, investigation: Investigation) -> RootCause:
         """Determine root cause from investigation.
@@ -502,23 +558,7 @@ class RootCauseAnalyzer:
         Returns:
             Category name
         """
-        categories = {
-            "SyntaxError": "syntax",
-            "IndentationError": "syntax",
-            "ImportError": "import",
-            "ModuleNotFoundError": "import",
-            "TypeError": "type",
-            "ValueError": "validation",
-            "KeyError": "data",
-            "IndexError": "data",
-            "AttributeError": "attribute",
-            "NameError": "reference",
-            "RuntimeError": "runtime",
-            "OSError": "system",
-            "IOError": "io",
-            "FileNotFoundError": "io",
-        }
-        return categories.get(error_type, "unknown")
+        return self.ERROR_CATEGORIES.get(error_type, "unknown")
 
     def _get_fix_suggestions(self, error_type: str, error_message: str) -> list[str]:
         """Get fix suggestions for error.
@@ -589,8 +629,9 @@ class RootCauseAnalyzer:
             }
 
         filepath.parent.mkdir(parents=True, exist_ok=True)
+        # json.dumps without indent uses the C encoder; json.dump never does
         with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+            f.write(json.dumps(data, separators=(",", ":")))
 
     def load_investigation(self, filepath: Path) -> Investigation:
         """Load investigation from file.
@@ -642,3 +683,15 @@ class RootCauseAnalyzer:
             )
 
         return investigation
+
+
+def _analyze_error(error: str) -> Investigation:
+    """Analyze one error in a worker process for RootCauseAnalyzer.analyze_batch.
+
+    Args:
+        error: Error message or traceback
+
+    Returns:
+        Investigation object
+    """
+    return RootCauseAnalyzer()._build_investigation(error)
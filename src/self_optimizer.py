@@ -9,12 +9,16 @@ This module provides self-optimization for autonomous development:
 - Integration with metrics
 """
 
+import contextlib
 import json
+import random
 import time
+from collections import Counter, deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 
 class OutcomeType(Enum):
@@ -35,7 +39,7 @@ class OptimizationStrategy(Enum):
     GRADIENT_DESCENT = "gradient_descent"
 
 
-@dataclass
+@dataclass(slots=True)
 class Outcome:
     """A recorded outcome."""
 
@@ -46,7 +50,7 @@ class Outcome:
     timestamp: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterRange:
     """Valid range for a parameter."""
 
@@ -77,7 +81,7 @@ class ParameterRange:
         return max(self.min_value, min(self.max_value, value))
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterHistoryEntry:
     """Entry in parameter history."""
 
@@ -85,18 +89,27 @@ class ParameterHistoryEntry:
     timestamp: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class TuningParameter:
-    """A parameter that can be tuned."""
+    """A parameter that can be tuned.
+
+    Only the most recent HISTORY_MAX values are kept; older ones are dropped.
+    The first value is kept separately so trends still measure from the start.
+    """
+
+    HISTORY_MAX: ClassVar[int] = 1024
 
     name: str
     current_value: float
     range: ParameterRange
-    history: list[ParameterHistoryEntry] = field(default_factory=list)
+    history: deque[ParameterHistoryEntry] = field(default_factory=deque)
+    _first: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Record initial value in history."""
+        """Bound the history to HISTORY_MAX entries and record initial value."""
+        self.history = deque(self.history, maxlen=self.HISTORY_MAX)
         self.history.append(ParameterHistoryEntry(value=self.current_value))
+        self._first = self.history[0].value
 
     def adjust(self, new_value: float) -> None:
         """Adjust parameter value.
@@ -107,6 +120,16 @@ class TuningParameter:
         self.current_value = self.range.clamp(new_value)
         self.history.append(ParameterHistoryEntry(value=self.current_value))
 
+    def change_from_start(self) -> float:
+        """Calculate value change from the first recorded value.
+
+        Returns:
+            Latest value minus the first value
+        """
+        if len(self.history) < 2:
+            return 0.0
+        return self.history[-1].value - self._first
+
 
 class SelfOptimizer:
     """Optimizes parameters based on outcomes."""
@@ -127,6 +150,7 @@ class SelfOptimizer:
         self._parameters: dict[str, TuningParameter] = {}
         self.outcomes: list[Outcome] = []
         self._optimization_steps = 0
+        self._batch_timestamp: float | None = None
 
     def register_parameter(
         self,
@@ -183,9 +207,27 @@ class SelfOptimizer:
             metric_name=metric_name,
             value=value,
             context=context or {},
+            timestamp=self._batch_timestamp or time.time(),
         )
         self.outcomes.append(outcome)
 
+    @contextlib.contextmanager
+    def batch(self):
+        """Context manager sharing one timestamp across recorded outcomes.
+
+        Outcomes recorded inside the block are stamped with the time the
+        batch started instead of reading the clock for each one.
+
+        Yields:
+            None
+        """
+        previous = self._batch_timestamp
+        self._batch_timestamp = previous or time.time()
+        try:
+            yield
+        finally:
+            self._batch_timestamp = previous
+
     def success_rate(self) -> float:
         """Calculate success rate.
 
@@ -194,7 +236,7 @@ class SelfOptimizer:
         """
         if not self.outcomes:
             return 1.0
-        successes = sum(1 for o in self.outcomes if o.outcome_type == OutcomeType.SUCCESS)
+        successes = sum(1 for o in self.outcomes if o.outcome_type is OutcomeType.SUCCESS)
         return successes / len(self.outcomes)
 
     def get_recommendations(self) -> dict[str, Any]:
@@ -207,15 +249,14 @@ class SelfOptimizer:
 
         # Analyze recent outcomes
         recent = self.outcomes[-20:] if len(self.outcomes) > 20 else self.outcomes
+
+        # Count outcome types in a single pass
+        type_counts = Counter(o.outcome_type for o in recent)
         recent_success_rate = (
-            sum(1 for o in recent if o.outcome_type == OutcomeType.SUCCESS) / len(recent)
-            if recent
-            else 1.0
+            type_counts[OutcomeType.SUCCESS] / len(recent) if recent else 1.0
         )
-
-        # Count outcome types
-        timeout_count = sum(1 for o in recent if o.outcome_type == OutcomeType.TIMEOUT)
-        failure_count = sum(1 for o in recent if o.outcome_type == OutcomeType.FAILURE)
+        timeout_count = type_counts[OutcomeType.TIMEOUT]
+        failure_count = type_counts[OutcomeType.FAILURE]
 
         # Generate recommendations based on patterns
         for name, param in self._parameters.items():
@@ -244,39 +285,43 @@ class SelfOptimizer:
     def optimize_step(self) -> None:
         """Perform one optimization step."""
         self._optimization_steps += 1
-        recommendations = self.get_recommendations()
-
-        # Apply recommendations based on strategy
-        if self.strategy == OptimizationStrategy.HILL_CLIMBING:
-            for name, rec in recommendations.items():
-                param = self._parameters.get(name)
-                if param and "suggested_value" in rec:
-                    # Apply with learning rate
-                    diff = rec["suggested_value"] - param.current_value
+
+        # Dispatch on strategy; strategies without a step function leave parameters as-is
+        step = _STRATEGY_STEPS.get(self.strategy)
+        if step is not None:
+            step(self)
+
+    def _hill_climbing_step(self) -> None:
+        """Move each recommended parameter toward its suggested value."""
+        for name, rec in self.get_recommendations().items():
+            param = self._parameters.get(name)
+            if param and "suggested_value" in rec:
+                # Apply with learning rate
+                diff = rec["suggested_value"] - param.current_value
+                new_value = param.current_value + (diff * self.learning_rate)
+                param.adjust(new_value)
+
+    def _random_search_step(self) -> None:
+        """Randomly nudge parameters by one step; ignores recommendations."""
+        for _name, param in self._parameters.items():
+            if random.random() < 0.2:  # 20% chance to adjust
+                # Random step in either direction
+                adjustment = random.choice([-1, 1]) * param.range.step
+                param.adjust(param.current_value + adjustment)
+
+    def _simulated_annealing_step(self) -> None:
+        """Apply recommendations, accepting worse moves with falling probability."""
+        # Temperature decreases with more outcomes (more certainty)
+        temperature = max(0.1, 1.0 - len(self.outcomes) / 100)
+        for name, rec in self.get_recommendations().items():
+            param = self._parameters.get(name)
+            if param and "suggested_value" in rec:
+                diff = rec["suggested_value"] - param.current_value
+                # Accept change based on temperature
+                if random.random() < temperature or diff > 0:
                     new_value = param.current_value + (diff * self.learning_rate)
                     param.adjust(new_value)
 
-        elif self.strategy == OptimizationStrategy.RANDOM_SEARCH:
-            import random
-            for _name, param in self._parameters.items():
-                if random.random() < 0.2:  # 20% chance to adjust
-                    # Random step in either direction
-                    adjustment = random.choice([-1, 1]) * param.range.step
-                    param.adjust(param.current_value + adjustment)
-
-        elif self.strategy == OptimizationStrategy.SIMULATED_ANNEALING:
-            import random
-            # Temperature decreases with more outcomes (more certainty)
-            temperature = max(0.1, 1.0 - len(self.outcomes) / 100)
-            for name, rec in recommendations.items():
-                param = self._parameters.get(name)
-                if param and "suggested_value" in rec:
-                    diff = rec["suggested_value"] - param.current_value
-                    # Accept change based on temperature
-                    if random.random() < temperature or diff > 0:
-                        new_value = param.current_value + (diff * self.learning_rate)
-                        param.adjust(new_value)
-
     def get_correlations(self) -> dict[str, float]:
         """Get correlations between parameters and outcomes.
 
@@ -284,18 +329,22 @@ class SelfOptimizer:
             Dictionary of correlations
         """
         correlations = {}
+        if len(self.outcomes) < 2:
+            return correlations
+
+        # The recent success score is shared by every parameter, so compute it once
+        recent_successes = sum(
+            1 for o in self.outcomes[-5:]
+            if o.outcome_type is OutcomeType.SUCCESS
+        )
+        score = recent_successes / 5
 
         # Simple correlation: track if parameter changes align with outcome changes
         for name, param in self._parameters.items():
-            if len(param.history) >= 2 and len(self.outcomes) >= 2:
-                # Check if parameter increases correlate with success
-                param_trend = param.history[-1].value - param.history[0].value
-                recent_successes = sum(
-                    1 for o in self.outcomes[-5:]
-                    if o.outcome_type == OutcomeType.SUCCESS
-                )
-                if param_trend != 0:
-                    correlations[name] = recent_successes / 5 if param_trend > 0 else -recent_successes / 5
+            # Check if parameter increases correlate with success
+            param_trend = param.change_from_start()
+            if param_trend != 0:
+                correlations[name] = score if param_trend > 0 else -score
 
         return correlations
 
@@ -355,6 +404,7 @@ class SelfOptimizer:
                     "min_value": param.range.min_value,
                     "max_value": param.range.max_value,
                     "step": param.range.step,
+                    "first_value": param._first,
                     "history": [
                         {"value": h.value, "timestamp": h.timestamp}
                         for h in param.history
@@ -376,7 +426,7 @@ class SelfOptimizer:
 
         filepath.parent.mkdir(parents=True, exist_ok=True)
         with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+            f.write(json.dumps(data, separators=(",", ":")))
 
     @classmethod
     def load(cls, filepath: Path) -> "SelfOptimizer":
@@ -409,13 +459,16 @@ class SelfOptimizer:
                 ),
             )
             # Clear auto-created history and restore actual history
-            param.history = [
+            param.history.clear()
+            param.history.extend(
                 ParameterHistoryEntry(
                     value=h["value"],
                     timestamp=h.get("timestamp", time.time()),
                 )
                 for h in param_data.get("history", [])
-            ]
+            )
+            if param.history:
+                param._first = param_data.get("first_value", param.history[0].value)
             optimizer._parameters[name] = param
 
         # Restore outcomes
@@ -430,3 +483,11 @@ class SelfOptimizer:
             optimizer.outcomes.append(outcome)
 
         return optimizer
+
+
+# Step function for each optimization strategy, looked up by optimize_step
+_STRATEGY_STEPS: dict[OptimizationStrategy, Callable[[SelfOptimizer], None]] = {
+    OptimizationStrategy.HILL_CLIMBING: SelfOptimizer._hill_climbing_step,
+    OptimizationStrategy.RANDOM_SEARCH: SelfOptimizer._random_search_step,
+    OptimizationStrategy.SIMULATED_ANNEALING: SelfOptimizer._simulated_annealing_step,
+}
@@ -9,18 +9,35 @@ This module provides test analysis for autonomous development:
 - Test impact analysis
 """
 
+import os
 import re
+from collections import deque
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
+from itertools import pairwise
 from pathlib import Path
 
+# Pattern for pytest output: path::test_name STATUS
+TEST_RESULT_PATTERN = re.compile(r"([\w/\.]+)::([\w_]+)\s+(PASSED|FAILED)")
 
-class TestType(Enum):
-    """Types of tests in the test pyramid."""
+# Pattern for the TOTAL line of a coverage report: any number of count columns
+# (statements, misses, branches...) followed by a possibly fractional percentage
+COVERAGE_TOTAL_PATTERN = re.compile(
+    r"^[ \t]*TOTAL(?:[ \t]+\d+)+[ \t]+(\d+(?:\.\d+)?)%", re.MULTILINE
+)
 
-    UNIT = "unit"
-    INTEGRATION = "integration"
-    E2E = "e2e"
+
+class TestType(IntEnum):
+    """Types of tests in the test pyramid.
+
+    Members are small ints so they can index per-type count arrays directly.
+    """
+
+    UNIT = 0
+    INTEGRATION = 1
+    E2E = 2
 
     @classmethod
     def from_path(cls, path: str) -> "TestType":
@@ -32,21 +49,40 @@ class TestType(Enum):
         Returns:
             TestType enum value
         """
-        path_lower = path.lower()
+        return _test_type_for_path(path)
+
+
+# Path substrings identifying non-unit tests, checked in order so E2E wins over
+# integration ("integ" also covers "integration")
+TEST_TYPE_MARKERS = (
+    ("e2e", TestType.E2E),
+    ("end_to_end", TestType.E2E),
+    ("end-to-end", TestType.E2E),
+    ("integ", TestType.INTEGRATION),
+)
+
+
+@lru_cache(maxsize=1024)
+def _test_type_for_path(path: str) -> TestType:
+    """Classify a test file path, cached because result lines repeat the same files.
+
+    Args:
+        path: Path to test file
 
-        # Check for E2E indicators
-        if "e2e" in path_lower or "end_to_end" in path_lower or "end-to-end" in path_lower:
-            return cls.E2E
+    Returns:
+        TestType enum value
+    """
+    path_lower = path.lower()
 
-        # Check for integration indicators
-        if "integration" in path_lower or "integ" in path_lower:
-            return cls.INTEGRATION
+    for marker, test_type in TEST_TYPE_MARKERS:
+        if marker in path_lower:
+            return test_type
 
-        # Default to unit
-        return cls.UNIT
+    # Default to unit
+    return TestType.UNIT
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of a single test execution."""
 
@@ -58,16 +94,71 @@ class TestResult:
     file_path: str = ""
 
 
-@dataclass
-class PyramidStats:
-    """Statistics for a test type."""
+@dataclass(frozen=True, slots=True)
+class Recommendation:
+    """A recommendation or violation with a stable code for programmatic checks.
 
-    passed: int = 0
-    failed: int = 0
+    Codes: ADD_UNIT_FIRST, NEED_MORE_UNIT, TOO_MANY_E2E, FIX_FAILING,
+    UNIT_RATIO_LOW, COVERAGE_LOW.
+    """
 
-    @property
-    def total(self) -> int:
-        return self.passed + self.failed
+    code: str
+    message: str
+
+    def __str__(self) -> str:
+        return self.message
+
+
+def _iter_test_results(output: str) -> Iterator[tuple[str, str, str]]:
+    """Parse pytest result lines, yielding (file_path, test_name, status).
+
+    Most output lines are logs or tracebacks, so cheap substring checks reject
+    them before the regex runs.
+
+    Args:
+        output: Raw pytest output
+
+    Yields:
+        Tuples of file path, test name and PASSED/FAILED status
+    """
+    for line in output.splitlines():
+        if "::" in line and ("PASSED" in line or "FAILED" in line):
+            yield from TEST_RESULT_PATTERN.findall(line)
+
+
+def _iter_test_files(root: str | os.PathLike[str]) -> Iterator[str]:
+    """Walk a directory tree with os.scandir, yielding test file paths.
+
+    Matches both test_*.py and *_test.py in one pass. Directory entries carry
+    their type, so no extra stat call or Path object is made per entry.
+    Directories that cannot be read are skipped, as Path.glob does.
+
+    Args:
+        root: Root directory to search
+
+    Yields:
+        Test file paths as strings
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            scanner = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with scanner as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (
+                    entry.name.endswith(".py")
+                    and (entry.name.startswith("test_") or entry.name.endswith("_test.py"))
+                    and entry.is_file()
+                ):
+                    yield entry.path
+
+
+# Report keys for each TestType, indexed by the member's int value
+TEST_TYPE_KEYS = ("unit", "integration", "e2e")
 
 
 class TestPyramid:
@@ -75,11 +166,9 @@ class TestPyramid:
 
     def __init__(self) -> None:
         """Initialize test pyramid."""
-        self._stats: dict[TestType, PyramidStats] = {
-            TestType.UNIT: PyramidStats(),
-            TestType.INTEGRATION: PyramidStats(),
-            TestType.E2E: PyramidStats(),
-        }
+        # Pass/fail counts indexed by TestType
+        self._passed = [0] * len(TestType)
+        self._failed = [0] * len(TestType)
 
     def add_test(self, test_type: TestType, passed: bool) -> None:
         """Add a test result to the pyramid.
@@ -88,11 +177,46 @@ class TestPyramid:
             test_type: Type of test
             passed: Whether test passed
         """
-        stats = self._stats[test_type]
         if passed:
-            stats.passed += 1
+            self._passed[test_type] += 1
         else:
-            stats.failed += 1
+            self._failed[test_type] += 1
+
+    def add_tests(self, results: Iterable[tuple[TestType, bool]]) -> None:
+        """Add many test results to the pyramid in one call.
+
+        Args:
+            results: (test_type, passed) pairs
+        """
+        passed_counts, failed_counts = self._passed, self._failed
+        for test_type, passed in results:
+            if passed:
+                passed_counts[test_type] += 1
+            else:
+                failed_counts[test_type] += 1
+
+    @property
+    def total_passed(self) -> int:
+        return sum(self._passed)
+
+    @property
+    def total_failed(self) -> int:
+        return sum(self._failed)
+
+    @property
+    def total(self) -> int:
+        return self.total_passed + self.total_failed
+
+    def count(self, test_type: TestType) -> int:
+        """Get the number of tests of one type.
+
+        Args:
+            test_type: Type of test
+
+        Returns:
+            Passed plus failed tests of that type
+        """
+        return self._passed[test_type] + self._failed[test_type]
 
     def get_ratio(self) -> dict[str, int]:
         """Get test counts by type.
@@ -101,9 +225,8 @@ class TestPyramid:
             Dictionary with test counts
         """
         return {
-            "unit": self._stats[TestType.UNIT].total,
-            "integration": self._stats[TestType.INTEGRATION].total,
-            "e2e": self._stats[TestType.E2E].total,
+            key: passed + failed
+            for key, passed, failed in zip(TEST_TYPE_KEYS, self._passed, self._failed, strict=True)
         }
 
     def get_stats(self) -> dict[str, dict[str, int]]:
@@ -113,18 +236,8 @@ class TestPyramid:
             Dictionary with pass/fail counts per type
         """
         return {
-            "unit": {
-                "passed": self._stats[TestType.UNIT].passed,
-                "failed": self._stats[TestType.UNIT].failed,
-            },
-            "integration": {
-                "passed": self._stats[TestType.INTEGRATION].passed,
-                "failed": self._stats[TestType.INTEGRATION].failed,
-            },
-            "e2e": {
-                "passed": self._stats[TestType.E2E].passed,
-                "failed": self._stats[TestType.E2E].failed,
-            },
+            key: {"passed": passed, "failed": failed}
+            for key, passed, failed in zip(TEST_TYPE_KEYS, self._passed, self._failed, strict=True)
         }
 
     def is_healthy_shape(self) -> bool:
@@ -135,55 +248,64 @@ class TestPyramid:
         Returns:
             True if pyramid shape is healthy
         """
-        ratio = self.get_ratio()
-        total = sum(ratio.values())
+        total = self.total
 
         if total == 0:
             return True  # No tests yet
 
         # Check that unit tests are the majority
-        unit_pct = ratio["unit"] / total
+        unit = self.count(TestType.UNIT)
+        e2e = self.count(TestType.E2E)
 
         # Unit should be at least 50% and more than E2E
-        return unit_pct >= 0.5 and ratio["unit"] > ratio["e2e"]
+        return unit / total >= 0.5 and unit > e2e
 
-    def get_recommendations(self) -> list[str]:
+    def get_recommendations(self) -> list[Recommendation]:
         """Get recommendations for improving pyramid.
 
         Returns:
-            List of recommendation strings
+            List of recommendations
         """
         recommendations = []
-        ratio = self.get_ratio()
-        total = sum(ratio.values())
+        total = self.total
 
         if total == 0:
-            recommendations.append("Add unit tests first")
+            recommendations.append(Recommendation("ADD_UNIT_FIRST", "Add unit tests first"))
             return recommendations
 
-        unit_pct = ratio["unit"] / total
+        unit = self.count(TestType.UNIT)
+        unit_pct = unit / total
 
         if unit_pct < 0.5:
             recommendations.append(
-                f"Add more unit tests. Currently {unit_pct:.0%}, recommend >= 50%"
+                Recommendation(
+                    "NEED_MORE_UNIT",
+                    f"Add more unit tests. Currently {unit_pct:.0%}, recommend >= 50%",
+                )
             )
 
-        if ratio["e2e"] > ratio["unit"]:
+        if self.count(TestType.E2E) > unit:
             recommendations.append(
-                "Too many E2E tests relative to unit tests. Consider converting some to unit tests."
+                Recommendation(
+                    "TOO_MANY_E2E",
+                    "Too many E2E tests relative to unit tests. "
+                    "Consider converting some to unit tests.",
+                )
             )
 
-        stats = self.get_stats()
-        for test_type, type_stats in stats.items():
-            if type_stats["failed"] > 0:
+        for test_type, failed in zip(TEST_TYPE_KEYS, self._failed, strict=True):
+            if failed > 0:
                 recommendations.append(
-                    f"Fix {type_stats['failed']} failing {test_type} test(s)"
+                    Recommendation(
+                        "FIX_FAILING",
+                        f"Fix {failed} failing {test_type} test(s)",
+                    )
                 )
 
         return recommendations
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverageDataPoint:
     """A single coverage measurement."""
 
@@ -192,7 +314,13 @@ class CoverageDataPoint:
 
 
 class CoverageTrend:
-    """Tracks coverage over time."""
+    """Tracks coverage over time.
+
+    Only the most recent HISTORY_MAX measurements are kept; the first one ever
+    recorded is remembered separately for change_from_start().
+    """
+
+    HISTORY_MAX = 64
 
     def __init__(self, threshold: float = 80.0) -> None:
         """Initialize coverage trend.
@@ -201,7 +329,9 @@ class CoverageTrend:
             threshold: Minimum acceptable coverage
         """
         self.threshold = threshold
-        self.history: list[float] = []
+        self.history: deque[float] = deque(maxlen=self.HISTORY_MAX)
+        self._first: float | None = None
+        self._direction: int | None = None
 
     def record(self, coverage: float) -> None:
         """Record a coverage measurement.
@@ -209,7 +339,31 @@ class CoverageTrend:
         Args:
             coverage: Coverage percentage (0-100)
         """
+        if self._first is None:
+            self._first = coverage
         self.history.append(coverage)
+        self._direction = None
+
+    def _recent(self) -> list[float]:
+        """Get the last three measurements (or all if fewer)."""
+        return [self.history[i] for i in range(-min(len(self.history), 3), 0)]
+
+    def _trend_direction(self) -> int:
+        """Get the recent trend direction, cached until the next record().
+
+        Returns:
+            1 if the last three values strictly rise, -1 if they strictly fall,
+            otherwise 0 (also 0 with fewer than two values)
+        """
+        if self._direction is None:
+            deltas = [b - a for a, b in pairwise(self._recent())]
+            if deltas and all(d > 0 for d in deltas):
+                self._direction = 1
+            elif deltas and all(d < 0 for d in deltas):
+                self._direction = -1
+            else:
+                self._direction = 0
+        return self._direction
 
     @property
     def latest(self) -> float | None:
@@ -222,12 +376,8 @@ class CoverageTrend:
         Returns:
             True if coverage is trending up
         """
-        if len(self.history) < 2:
-            return False
-
         # Check last 3 values (or all if < 3)
-        recent = self.history[-3:]
-        return all(recent[i] < recent[i + 1] for i in range(len(recent) - 1))
+        return self._trend_direction() > 0
 
     def is_declining(self) -> bool:
         """Check if coverage is declining.
@@ -235,11 +385,7 @@ class CoverageTrend:
         Returns:
             True if coverage is trending down
         """
-        if len(self.history) < 2:
-            return False
-
-        recent = self.history[-3:]
-        return all(recent[i] > recent[i + 1] for i in range(len(recent) - 1))
+        return self._trend_direction() < 0
 
     def is_stable(self) -> bool:
         """Check if coverage is stable (within 2%).
@@ -250,7 +396,7 @@ class CoverageTrend:
         if len(self.history) < 2:
             return True
 
-        recent = self.history[-3:]
+        recent = self._recent()
         return max(recent) - min(recent) < 2.0
 
     def meets_threshold(self) -> bool:
@@ -267,9 +413,9 @@ class CoverageTrend:
         Returns:
             Coverage change in percentage points
         """
-        if len(self.history) < 2:
+        if len(self.history) < 2 or self._first is None:
             return 0.0
-        return self.history[-1] - self.history[0]
+        return self.history[-1] - self._first
 
 
 class TestAnalyzer:
@@ -291,7 +437,9 @@ class TestAnalyzer:
         self.pyramid = TestPyramid()
         self.coverage_trend = CoverageTrend(threshold=min_coverage)
         self._results: list[TestResult] = []
-        self._test_mappings: dict[str, list[str]] = {}
+        # Outcomes seen per test name, kept in step with _results for flaky detection
+        self._outcomes_by_name: dict[str, set[bool]] = {}
+        self._test_mappings: dict[str, tuple[str, ...]] = {}
 
     def record_result(self, result: TestResult) -> None:
         """Record a test result.
@@ -300,22 +448,25 @@ class TestAnalyzer:
             result: TestResult to record
         """
         self._results.append(result)
+        self._outcomes_by_name.setdefault(result.name, set()).add(result.passed)
         self.pyramid.add_test(result.test_type, result.passed)
 
-    def analyze_output(self, output: str) -> None:
+    def analyze_output(self, output: str, *, record_results: bool = True) -> None:
         """Analyze pytest output.
 
         Args:
             output: Raw pytest output
+            record_results: Keep a TestResult per test for flaky detection. When
+                False, only the pyramid counts are updated and no results are built.
         """
-        # Pattern for pytest output: path::test_name STATUS
-        pattern = r"([\w/\.]+)::([\w_]+)\s+(PASSED|FAILED)"
-
-        for match in re.finditer(pattern, output):
-            file_path = match.group(1)
-            test_name = match.group(2)
-            status = match.group(3)
+        if not record_results:
+            self.pyramid.add_tests(
+                (_test_type_for_path(file_path), status == "PASSED")
+                for file_path, _test_name, status in _iter_test_results(output)
+            )
+            return
 
+        for file_path, test_name, status in _iter_test_results(output):
             test_type = TestType.from_path(file_path)
             passed = status == "PASSED"
 
@@ -338,8 +489,7 @@ class TestAnalyzer:
             Coverage percentage or None
         """
         # Look for TOTAL line with percentage
-        pattern = r"TOTAL\s+\d+\s+\d+\s+(\d+)%"
-        match = re.search(pattern, output)
+        match = COVERAGE_TOTAL_PATTERN.search(output)
 
         if match:
             coverage = float(match.group(1))
@@ -354,17 +504,12 @@ class TestAnalyzer:
         Returns:
             Summary dictionary
         """
-        ratio = self.pyramid.get_ratio()
-        stats = self.pyramid.get_stats()
-
-        total_tests = sum(ratio.values())
-        total_passed = sum(s["passed"] for s in stats.values())
-        total_failed = sum(s["failed"] for s in stats.values())
+        pyramid = self.pyramid
 
         return {
-            "total_tests": total_tests,
-            "passed": total_passed,
-            "failed": total_failed,
+            "total_tests": pyramid.total,
+            "passed": pyramid.total_passed,
+            "failed": pyramid.total_failed,
             "coverage": self.coverage_trend.latest,
             "coverage_trend": "improving"
             if self.coverage_trend.is_improving()
@@ -372,9 +517,9 @@ class TestAnalyzer:
             if self.coverage_trend.is_declining()
             else "stable",
             "pyramid_health": "healthy"
-            if self.pyramid.is_healthy_shape()
+            if pyramid.is_healthy_shape()
             else "unhealthy",
-            "ratio": ratio,
+            "ratio": pyramid.get_ratio(),
         }
 
     def get_flaky_candidates(self) -> list[str]:
@@ -385,31 +530,26 @@ class TestAnalyzer:
         Returns:
             List of potentially flaky test names
         """
-        test_outcomes: dict[str, set[bool]] = {}
-
-        for result in self._results:
-            if result.name not in test_outcomes:
-                test_outcomes[result.name] = set()
-            test_outcomes[result.name].add(result.passed)
-
         # Tests with both True and False outcomes are flaky
-        return [name for name, outcomes in test_outcomes.items() if len(outcomes) > 1]
+        return [name for name, outcomes in self._outcomes_by_name.items() if len(outcomes) > 1]
 
-    def check_pyramid_enforcement(self) -> list[str]:
+    def check_pyramid_enforcement(self) -> list[Recommendation]:
         """Check if test pyramid requirements are met.
 
         Returns:
             List of violations
         """
         violations = []
-        ratio = self.pyramid.get_ratio()
-        total = sum(ratio.values())
+        total = self.pyramid.total
 
         if total > 0:
-            unit_ratio = ratio["unit"] / total
+            unit_ratio = self.pyramid.count(TestType.UNIT) / total
             if unit_ratio < self.min_unit_ratio:
                 violations.append(
-                    f"Unit test ratio {unit_ratio:.0%} below minimum {self.min_unit_ratio:.0%}"
+                    Recommendation(
+                        "UNIT_RATIO_LOW",
+                        f"Unit test ratio {unit_ratio:.0%} below minimum {self.min_unit_ratio:.0%}",
+                    )
                 )
 
         if (
@@ -417,7 +557,10 @@ class TestAnalyzer:
             and self.coverage_trend.latest < self.min_coverage
         ):
             violations.append(
-                f"Coverage {self.coverage_trend.latest:.1f}% below minimum {self.min_coverage}%"
+                Recommendation(
+                    "COVERAGE_LOW",
+                    f"Coverage {self.coverage_trend.latest:.1f}% below minimum {self.min_coverage}%",
+                )
             )
 
         return violations
@@ -431,10 +574,7 @@ class TestAnalyzer:
         Returns:
             List of test file paths
         """
-        tests = []
-        for pattern in ["**/test_*.py", "**/*_test.py"]:
-            tests.extend(root.glob(pattern))
-        return tests
+        return [Path(path) for path in _iter_test_files(root)]
 
     def categorize_tests(self, root: Path) -> dict[TestType, list[Path]]:
         """Categorize discovered tests by type.
@@ -445,15 +585,11 @@ class TestAnalyzer:
         Returns:
             Dictionary of test type to file paths
         """
-        categorized: dict[TestType, list[Path]] = {
-            TestType.UNIT: [],
-            TestType.INTEGRATION: [],
-            TestType.E2E: [],
-        }
+        categorized: dict[TestType, list[Path]] = {test_type: [] for test_type in TestType}
 
-        for test_file in self.discover_tests(root):
-            test_type = TestType.from_path(str(test_file))
-            categorized[test_type].append(test_file)
+        # Classify the walker's path strings directly; Path objects only for results
+        for test_file in _iter_test_files(root):
+            categorized[_test_type_for_path(test_file)].append(Path(test_file))
 
         return categorized
 
@@ -464,7 +600,7 @@ class TestAnalyzer:
             source_file: Source file path
             test_files: Related test files
         """
-        self._test_mappings[source_file] = test_files
+        self._test_mappings[source_file] = tuple(test_files)
 
     def get_affected_tests(self, changed_files: list[str]) -> list[str] | None:
         """Get tests affected by file changes.
@@ -475,13 +611,14 @@ class TestAnalyzer:
         Returns:
             List of test files to run, or None to run all
         """
-        affected = set()
+        affected: set[str] = set()
+        mappings = self._test_mappings
 
+        # Single lookup per changed file
         for source_file in changed_files:
-            if source_file in self._test_mappings:
-                affected.update(self._test_mappings[source_file])
+            affected.update(mappings.get(source_file, ()))
 
         if not affected:
             return None  # No mapping found, run all tests
 
-        return list(affected)
+        return sorted(affected)
@@ -4,6 +4,8 @@ import tempfile
 import time
 from pathlib import Path
 
+import pytest
+
 from src.progress_tracker import (
     EffortEstimate,
     EffortUnit,
@@ -76,6 +78,11 @@ class TestEffortEstimate:
         day_estimate = EffortEstimate(value=2, unit=EffortUnit.DAYS)
         assert day_estimate.to_hours() >= 16
 
+    def test_estimate_to_hours_fixed_units(self):
+        """Should convert hours and tokens at fixed rates."""
+        assert EffortEstimate(value=3, unit=EffortUnit.HOURS).to_hours() == 3
+        assert EffortEstimate(value=20000, unit=EffortUnit.TOKENS).to_hours() == pytest.approx(2)
+
     def test_estimate_comparison(self):
         """Should compare estimates."""
         small = EffortEstimate(value=2, unit=EffortUnit.HOURS)
@@ -128,6 +135,15 @@ class TestTaskProgress:
 
         assert len(progress.notes) == 2
 
+    def test_notes_are_bounded(self):
+        """Should keep only the most recent notes."""
+        progress = TaskProgress(task_id="F001", name="Feature 1")
+        for i in range(TaskProgress.NOTES_MAX + 10):
+            progress.add_note(f"Note {i}")
+
+        assert len(progress.notes) == TaskProgress.NOTES_MAX
+        assert progress.notes[0] == "Note 10"
+
     def test_set_estimate(self):
         """Should set effort estimate."""
         progress = TaskProgress(task_id="F001", name="Feature 1")
@@ -281,6 +281,19 @@ class TestInvestigation:
         assert len(top) == 2
         assert top[0].confidence >= top[1].confidence
 
+    def test_top_hypotheses_reflect_confidence_changes(self):
+        """Should rank hypotheses by their confidence at query time."""
+        investigation = Investigation(error_message="Test error", error_type="TestError")
+        low = Hypothesis(description="Low", confidence=0.3)
+        investigation.add_hypothesis(Hypothesis(description="High", confidence=0.6))
+        investigation.add_hypothesis(low)
+
+        low.confidence = 0.9
+        investigation.hypotheses.append(Hypothesis(description="Top", confidence=0.95))
+
+        top = investigation.get_top_hypotheses(limit=2)
+        assert [h.description for h in top] == ["Top", "Low"]
+
 
 class TestRootCauseAnalyzer:
     """Tests for root cause analyzer."""
@@ -326,6 +339,21 @@ ValueError: invalid literal
         assert "src/utils.py" in files
         assert "src/core.py" in files
 
+    def test_analyze_skips_pseudo_files(self):
+        """Should ignore <stdin>-style frames in the traceback."""
+        analyzer = RootCauseAnalyzer()
+
+        error = """
+Traceback (most recent call last):
+  File "<stdin>", line 1
+  File "src/main.py", line 10
+  File '<string>', line 3
+ValueError: invalid literal
+"""
+        investigation = analyzer.analyze(error)
+
+        assert investigation.get_affected_files() == ["src/main.py"]
+
     def test_generate_hypotheses(self):
         """Should generate hypotheses from evidence."""
         analyzer = RootCauseAnalyzer()
@@ -507,3 +535,65 @@ TypeError: expected string or bytes-like object
         assert "KeyError" in error_types
         assert "TypeError" in error_types
         assert "ImportError" in error_types
+
+    def test_analyze_batch(self):
+        """Should analyze a batch of errors in parallel, preserving order."""
+        analyzer = RootCauseAnalyzer()
+
+        errors = [
+            "KeyError: 'user_id'",
+            "TypeError: cannot unpack non-iterable NoneType object",
+            "ImportError: No module named 'missing'",
+        ]
+
+        investigations = analyzer.analyze_batch(errors, max_workers=2)
+
+        assert [inv.error_type for inv in investigations] == [
+            "KeyError",
+            "TypeError",
+            "ImportError",
+        ]
+        assert all(inv.hypotheses for inv in investigations)
+        assert analyzer._investigations == investigations
+
+    def test_analyze_batch_in_process(self):
+        """Should match analyze() when run without worker processes."""
+        analyzer = RootCauseAnalyzer()
+        error = 'File "src/app.py", line 3\nKeyError: \'user_id\''
+
+        (batched,) = analyzer.analyze_batch([error], max_workers=1)
+        single = analyzer.analyze(error)
+
+        assert batched.error_type == single.error_type
+        assert batched.get_affected_files() == single.get_affected_files()
+        assert batched.hypotheses == single.hypotheses
+
+    def test_analyze_batch_matches_serial(self):
+        """Should produce the same investigations as analyzing one by one."""
+        errors = [
+            'File "src/app.py", line 3\nKeyError: \'user_id\'',
+            "TypeError: cannot unpack non-iterable NoneType object",
+            "AttributeError: 'NoneType' object has no attribute 'get'",
+            "ImportError: No module named 'missing'",
+        ]
+
+        batched = RootCauseAnalyzer().analyze_batch(errors, max_workers=2)
+        serial = [RootCauseAnalyzer().analyze(error) for error in errors]
+
+        for b, s in zip(batched, serial, strict=True):
+            assert b.error_type == s.error_type
+            assert b.get_affected_files() == s.get_affected_files()
+            assert b.hypotheses == s.hypotheses
+
+    def test_analyze_batch_respects_subclass(self):
+        """Should apply subclass overrides to every error in the batch."""
+
+        class TaggingAnalyzer(RootCauseAnalyzer):
+            def _extract_error_type(self, error):
+                return "Tagged"
+
+        analyzer = TaggingAnalyzer()
+        investigations = analyzer.analyze_batch(["KeyError: 'a'", "KeyError: 'b'"], max_workers=2)
+
+        assert [inv.error_type for inv in investigations] == ["Tagged", "Tagged"]
+        assert analyzer._investigations == investigations
@@ -123,6 +123,31 @@ class TestTuningParameter:
 
         assert len(param.history) >= 3
 
+    def test_parameter_history_is_bounded(self):
+        """Should keep only the most recent history entries."""
+        param = TuningParameter(
+            name="timeout",
+            current_value=0,
+            range=ParameterRange(min_value=0, max_value=10_000, step=1),
+        )
+        for i in range(1, TuningParameter.HISTORY_MAX + 10):
+            param.adjust(i)
+
+        assert len(param.history) == TuningParameter.HISTORY_MAX
+        assert param.history[0].value == 10
+
+    def test_parameter_change_survives_eviction(self):
+        """Should measure change from the first value after history is trimmed."""
+        param = TuningParameter(
+            name="timeout",
+            current_value=0,
+            range=ParameterRange(min_value=0, max_value=10_000, step=1),
+        )
+        for i in range(1, TuningParameter.HISTORY_MAX + 10):
+            param.adjust(i)
+
+        assert param.change_from_start() == TuningParameter.HISTORY_MAX + 9
+
     def test_parameter_bounded_adjustment(self):
         """Should bound adjustments to range."""
         param = TuningParameter(
@@ -238,6 +263,32 @@ class TestSelfOptimizer:
         rate = optimizer.success_rate()
         assert rate == 0.7
 
+    def test_success_rate_follows_outcomes(self):
+        """Should reflect outcomes added or removed through the list."""
+        optimizer = SelfOptimizer()
+        optimizer.record_outcome(OutcomeType.FAILURE, "test", 0)
+        optimizer.outcomes.append(
+            Outcome(outcome_type=OutcomeType.SUCCESS, metric_name="test", value=1)
+        )
+        assert optimizer.success_rate() == 0.5
+
+        optimizer.outcomes.clear()
+        assert optimizer.success_rate() == 1.0
+
+    def test_batch_shares_timestamp(self):
+        """Should stamp outcomes recorded in a batch with one timestamp."""
+        optimizer = SelfOptimizer()
+
+        with optimizer.batch():
+            for _ in range(3):
+                optimizer.record_outcome(OutcomeType.SUCCESS, "test", 1)
+        optimizer.record_outcome(OutcomeType.SUCCESS, "test", 1)
+
+        batched = {o.timestamp for o in optimizer.outcomes[:3]}
+        assert len(batched) == 1
+        assert optimizer.outcomes[3].timestamp >= batched.pop()
+        assert optimizer._batch_timestamp is None
+
     def test_outcome_correlation(self):
         """Should correlate outcomes with parameters."""
         optimizer = SelfOptimizer()
@@ -275,6 +326,18 @@ class TestSelfOptimizer:
         optimizer.set_strategy(OptimizationStrategy.SIMULATED_ANNEALING)
         assert optimizer.strategy == OptimizationStrategy.SIMULATED_ANNEALING
 
+    def test_optimize_step_every_strategy(self):
+        """Should run a step under every strategy and keep parameters in range."""
+        for strategy in OptimizationStrategy:
+            optimizer = SelfOptimizer(strategy=strategy)
+            optimizer.register_parameter("retry_limit", 3, 1, 10, 1)
+            for _ in range(5):
+                optimizer.record_outcome(OutcomeType.FAILURE, "test", 0)
+
+            optimizer.optimize_step()
+
+            assert 1 <= optimizer.get_parameter("retry_limit").current_value <= 10
+
     def test_get_summary(self):
         """Should provide optimization summary."""
         optimizer = SelfOptimizer()
@@ -293,12 +356,15 @@ class TestSelfOptimizer:
 
             optimizer = SelfOptimizer()
             optimizer.register_parameter("timeout", 30, 10, 120, 10)
+            optimizer.get_parameter("timeout").adjust(50)
             optimizer.record_outcome(OutcomeType.SUCCESS, "tests", 25)
             optimizer.save(filepath)
 
             loaded = SelfOptimizer.load(filepath)
             assert loaded.get_parameter("timeout") is not None
             assert len(loaded.outcomes) == 1
+            assert loaded.success_rate() == 1.0
+            assert loaded.get_parameter("timeout").change_from_start() == 20
 
 
 class TestSelfOptimizerIntegration:
@@ -1,7 +1,6 @@
 """Tests for test pyramid enforcement and coverage trending."""
 
-import tempfile
-from pathlib import Path
+import pytest
 
 from src.test_analyzer import (
     CoverageTrend,
@@ -12,6 +11,12 @@ from src.test_analyzer import (
 )
 
 
+@pytest.fixture
+def analyzer() -> TestAnalyzer:
+    """Fresh analyzer per test; TestAnalyzer accumulates results and coverage."""
+    return TestAnalyzer()
+
+
 class TestTestType:
     """Tests for test type classification."""
 
@@ -34,6 +39,10 @@ class TestTestType:
         """Should default ambiguous tests to unit."""
         assert TestType.from_path("tests/test_something.py") == TestType.UNIT
 
+    def test_types_are_array_indices(self):
+        """Should number types 0..n-1 so they can index count arrays."""
+        assert list(TestType) == list(range(len(TestType)))
+
 
 class TestTestResult:
     """Tests for test result tracking."""
@@ -112,6 +121,33 @@ class TestTestPyramid:
         assert stats["unit"]["passed"] == 2
         assert stats["unit"]["failed"] == 1
 
+    def test_pyramid_totals(self):
+        """Should expose totals without building the stats dicts."""
+        pyramid = TestPyramid()
+        pyramid.add_test(TestType.UNIT, passed=True)
+        pyramid.add_test(TestType.UNIT, passed=False)
+        pyramid.add_test(TestType.E2E, passed=True)
+
+        assert (pyramid.total, pyramid.total_passed, pyramid.total_failed) == (3, 2, 1)
+        assert pyramid.count(TestType.UNIT) == 2
+        assert pyramid.count(TestType.INTEGRATION) == 0
+
+    def test_add_tests_bulk(self):
+        """Should count a batch of results like repeated add_test calls."""
+        results = [
+            (TestType.UNIT, True),
+            (TestType.UNIT, False),
+            (TestType.INTEGRATION, True),
+            (TestType.E2E, False),
+        ]
+        bulk = TestPyramid()
+        bulk.add_tests(results)
+        single = TestPyramid()
+        for test_type, passed in results:
+            single.add_test(test_type, passed)
+
+        assert bulk.get_stats() == single.get_stats()
+
     def test_pyramid_recommendations(self):
         """Should provide recommendations."""
         pyramid = TestPyramid()
@@ -120,7 +156,8 @@ class TestTestPyramid:
         pyramid.add_test(TestType.E2E, passed=True)
 
         recommendations = pyramid.get_recommendations()
-        assert any("unit" in r.lower() for r in recommendations)
+        assert any(r.code == "NEED_MORE_UNIT" for r in recommendations)
+        assert any("unit" in r.message.lower() for r in recommendations)
 
 
 class TestCoverageTrend:
@@ -185,6 +222,16 @@ class TestCoverageTrend:
 
         assert trend.change_from_start() == 4.0
 
+    def test_history_is_bounded(self):
+        """Should keep recent history only but measure change from the first value."""
+        trend = CoverageTrend()
+        for i in range(CoverageTrend.HISTORY_MAX + 10):
+            trend.record(50.0 + i * 0.1)
+
+        assert len(trend.history) == CoverageTrend.HISTORY_MAX
+        assert trend.change_from_start() == pytest.approx((CoverageTrend.HISTORY_MAX + 9) * 0.1)
+        assert trend.is_improving()
+
 
 class TestTestAnalyzer:
     """Tests for the main test analyzer."""
@@ -194,9 +241,8 @@ class TestTestAnalyzer:
         analyzer = TestAnalyzer()
         assert analyzer is not None
 
-    def test_analyze_test_output(self):
+    def test_analyze_test_output(self, analyzer):
         """Should analyze pytest output."""
-        analyzer = TestAnalyzer()
         output = """
         tests/test_foo.py::test_one PASSED
         tests/test_foo.py::test_two PASSED
@@ -210,9 +256,22 @@ class TestTestAnalyzer:
         assert stats["unit"]["failed"] == 1
         assert stats["integration"]["passed"] == 1
 
-    def test_analyze_coverage_output(self):
+    def test_analyze_output_stats_only(self, analyzer):
+        """Should update pyramid counts without keeping results when asked."""
+        output = """
+        tests/test_foo.py::test_one PASSED
+        tests/test_foo.py::test_one FAILED
+        tests/e2e/test_flow.py::test_login PASSED
+        """
+        analyzer.analyze_output(output, record_results=False)
+
+        stats = analyzer.pyramid.get_stats()
+        assert stats["unit"] == {"passed": 1, "failed": 1}
+        assert stats["e2e"]["passed"] == 1
+        assert analyzer.get_flaky_candidates() == []
+
+    def test_analyze_coverage_output(self, analyzer):
         """Should extract coverage from output."""
-        analyzer = TestAnalyzer()
         output = """
         Name                 Stmts   Miss  Cover
         ----------------------------------------
@@ -222,9 +281,22 @@ class TestTestAnalyzer:
         coverage = analyzer.extract_coverage(output)
         assert coverage == 80.0
 
-    def test_get_summary(self):
+    def test_analyze_branch_coverage_output(self, analyzer):
+        """Should extract fractional coverage from a branch coverage report."""
+        output = """
+Name            Stmts   Miss Branch BrPart   Cover
+--------------------------------------------------
+src/module.py      50     10     20      4  78.57%
+TOTAL             100     20     40      8  78.57%
+"""
+        assert analyzer.extract_coverage(output) == 78.57
+
+    def test_coverage_requires_total_line(self, analyzer):
+        """Should ignore TOTAL appearing mid-line."""
+        assert analyzer.extract_coverage("GRAND TOTAL 100 20 80%") is None
+
+    def test_get_summary(self, analyzer):
         """Should provide test summary."""
-        analyzer = TestAnalyzer()
         analyzer.pyramid.add_test(TestType.UNIT, passed=True)
         analyzer.pyramid.add_test(TestType.UNIT, passed=True)
         analyzer.coverage_trend.record(80.0)
@@ -234,9 +306,8 @@ class TestTestAnalyzer:
         assert "coverage" in summary
         assert "pyramid_health" in summary
 
-    def test_identify_flaky_candidates(self):
+    def test_identify_flaky_candidates(self, analyzer):
         """Should identify potentially flaky tests."""
-        analyzer = TestAnalyzer()
         # Same test passes and fails
         analyzer.record_result(TestResult(
             name="test_flaky", test_type=TestType.UNIT, passed=True, duration_ms=100
@@ -264,51 +335,69 @@ class TestTestAnalyzer:
 
         violations = analyzer.check_pyramid_enforcement()
         assert len(violations) > 0
-        assert any("unit" in v.lower() for v in violations)
+        assert any(v.code == "UNIT_RATIO_LOW" for v in violations)
+        assert any("unit" in str(v).lower() for v in violations)
 
 
 class TestTestDiscovery:
     """Tests for test file discovery."""
 
-    def test_discover_tests(self):
+    def test_discover_tests(self, analyzer, tmp_path):
         """Should discover test files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create test structure
-            test_dir = Path(tmpdir) / "tests"
-            test_dir.mkdir()
-            (test_dir / "test_unit.py").write_text("def test_foo(): pass")
-            (test_dir / "integration").mkdir()
-            (test_dir / "integration" / "test_api.py").write_text("def test_api(): pass")
+        # Create test structure
+        test_dir = tmp_path / "tests"
+        test_dir.mkdir()
+        (test_dir / "test_unit.py").write_text("def test_foo(): pass")
+        (test_dir / "integration").mkdir()
+        (test_dir / "integration" / "test_api.py").write_text("def test_api(): pass")
 
-            analyzer = TestAnalyzer()
-            tests = analyzer.discover_tests(Path(tmpdir))
+        tests = analyzer.discover_tests(tmp_path)
 
-            assert len(tests) == 2
-            assert any("test_unit.py" in str(t) for t in tests)
+        assert len(tests) == 2
+        assert any("test_unit.py" in str(t) for t in tests)
 
-    def test_categorize_discovered_tests(self):
+    def test_discover_matches_both_conventions_once(self, analyzer, tmp_path):
+        """Should find test_*.py and *_test.py files, listing each file once."""
+        (tmp_path / "test_a.py").write_text("")
+        (tmp_path / "b_test.py").write_text("")
+        (tmp_path / "test_c_test.py").write_text("")
+        (tmp_path / "helpers.py").write_text("")
+
+        tests = analyzer.discover_tests(tmp_path)
+
+        assert sorted(t.name for t in tests) == ["b_test.py", "test_a.py", "test_c_test.py"]
+
+    def test_discover_missing_root(self, analyzer, tmp_path):
+        """Should find no tests under a directory that does not exist."""
+        assert analyzer.discover_tests(tmp_path / "missing") == []
+
+    def test_discover_file_root(self, analyzer, tmp_path):
+        """Should find no tests when the root is a file."""
+        root = tmp_path / "test_file.py"
+        root.write_text("")
+
+        assert analyzer.discover_tests(root) == []
+
+    def test_categorize_discovered_tests(self, analyzer, tmp_path):
         """Should categorize discovered tests."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir) / "tests"
-            test_dir.mkdir()
-            (test_dir / "unit").mkdir()
-            (test_dir / "unit" / "test_foo.py").write_text("def test_foo(): pass")
-            (test_dir / "e2e").mkdir()
-            (test_dir / "e2e" / "test_flow.py").write_text("def test_flow(): pass")
+        test_dir = tmp_path / "tests"
+        test_dir.mkdir()
+        (test_dir / "unit").mkdir()
+        (test_dir / "unit" / "test_foo.py").write_text("def test_foo(): pass")
+        (test_dir / "e2e").mkdir()
+        (test_dir / "e2e" / "test_flow.py").write_text("def test_flow(): pass")
 
-            analyzer = TestAnalyzer()
-            categorized = analyzer.categorize_tests(Path(tmpdir))
+        categorized = analyzer.categorize_tests(tmp_path)
 
-            assert TestType.UNIT in categorized
-            assert TestType.E2E in categorized
+        assert TestType.UNIT in categorized
+        assert TestType.E2E in categorized
 
 
 class TestTestImpact:
     """Tests for test impact analysis."""
 
-    def test_map_file_to_tests(self):
+    def test_map_file_to_tests(self, analyzer):
         """Should map source files to relevant tests."""
-        analyzer = TestAnalyzer()
         # Register mapping
         analyzer.register_test_mapping("src/auth.py", ["tests/test_auth.py"])
         analyzer.register_test_mapping("src/api.py", ["tests/integration/test_api.py"])
@@ -316,9 +405,8 @@ class TestTestImpact:
         tests = analyzer.get_affected_tests(["src/auth.py"])
         assert "tests/test_auth.py" in tests
 
-    def test_no_mapping_returns_all(self):
+    def test_no_mapping_returns_all(self, analyzer):
         """Should return all tests if no mapping exists."""
-        analyzer = TestAnalyzer()
         tests = analyzer.get_affected_tests(["src/unknown.py"])
         # Should indicate to run all tests
         assert tests == [] or tests is None  # Convention for "run all"